@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Common functionality of containers for 1D atmospheric profiles."""
+import copy
+from abc import ABC, abstractmethod
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Optional
+
+import f90nml
+import iris
+import iris.cube
+import iris.util
+import mule
+import pandas as pd
+from aeolus.const import init_const
+from aeolus.meta import update_metadata
+
+from dump_modifiers import set_fields_to_real
+
+
+@lru_cache(maxsize=32)
+def _cached_init_const(sim_case, const_dir):
+    """Load planetary constants once per case and directory."""
+    return init_const(sim_case, directory=const_dir)
+
+
+def _cached(func):
+    """Store the result of a container method in the instance's `_cache`."""
+
+    @wraps(func)
+    def wrapper(self):
+        try:
+            return self._cache[func]
+        except KeyError:
+            result = self._cache[func] = func(self)
+            return result
+
+    return wrapper
+
+
+class _AtmosphereContainer(ABC):
+    """
+    Base container for 1D atmospheric profiles.
+
+    Subclasses provide `_COLUMNS`, a mapping of variable names to the column
+    names in the source table, `_series_to_cube()` to convert a column to a cube,
+    and `_load_data()` to read the table.
+    """
+
+    __slots__ = (
+        "sim_case",
+        "data_dir",
+        "const",
+        "kappa",
+        "_kappa_f",
+        "data",
+        "_cache",
+    )
+
+    z_name = "level_height"
+    _COLUMNS = {}
+
+    def __init__(self, sim_case: str, const_dir: Path, data_dir: Path) -> None:
+        """
+        Initialise the container.
+
+        Parameters
+        ----------
+        sim_case: str
+            MALBEC case.
+        const_dir: Path
+            Directory with planetary constants.
+        data_dir: Path
+            Directory with input data for all cases.
+        """
+        self.sim_case = sim_case
+        self.data_dir = data_dir
+
+        # Set planetary and atmospheric constants
+        # (a copy, so that modifying them does not affect other containers)
+        self.const = copy.deepcopy(_cached_init_const(self.sim_case, const_dir))
+        self.kappa = (
+            self.const.dry_air_gas_constant / self.const.dry_air_spec_heat_press
+        )
+        self._kappa_f = float(self.kappa.data)
+
+        self._cache = {}
+        self.data = self._load_data()
+
+    @property
+    def _file_label(self) -> str:
+        """Label used in output file names."""
+        return self.sim_case
+
+    @abstractmethod
+    def _load_data(self) -> pd.DataFrame:
+        """Load the table of atmospheric profiles."""
+
+    @staticmethod
+    @abstractmethod
+    def _series_to_cube(
+        df: pd.DataFrame, column_name: str, cube_name: str, si_units: str, z_name: str
+    ) -> iris.cube.Cube:
+        """Convert a column of the table to an iris cube."""
+
+    def _cube(self, var_name: str, cube_name: str, si_units: str) -> iris.cube.Cube:
+        """Make a cube from the column corresponding to `var_name`."""
+        column_name = self._COLUMNS[var_name]
+        if column_name in self.data.columns:
+            df = self.data
+        else:
+            # The vertical coordinate is stored in the index
+            df = self.data.reset_index()
+        return self._series_to_cube(
+            df, column_name, cube_name, si_units, z_name=self.z_name
+        )
+
+    @property
+    @_cached
+    def height(self):
+        return self._cube("height", self.z_name, "m")
+
+    @property
+    @_cached
+    def temperature(self):
+        return self._cube("temperature", "air_temperature", "K")
+
+    @property
+    @_cached
+    def pressure(self):
+        return self._cube("pressure", "air_pressure", "Pa")
+
+    @property
+    @_cached
+    def humidity_mixing_ratio(self):
+        return self._cube("humidity_mixing_ratio", "humidity_mixing_ratio", "kg kg-1")
+
+    # Derived variables
+    @property
+    @_cached
+    @update_metadata(name="dimensionless_exner_function", units="1")
+    def exner(self):
+        return (self.pressure / self.const.reference_surface_pressure) ** self._kappa_f
+
+    @property
+    @_cached
+    @update_metadata(name="air_potential_temperature", units="K")
+    def potential_temperature(self):
+        return self.temperature / self.exner
+
+    def save_p_t_profile(self, outdir: Optional[Path] = None) -> None:
+        """Save the P-T profile in netCDF format for the idealised reconfiguration in the UM."""
+        if (_outdir := outdir) is None:
+            _outdir = self.data_dir / self.sim_case
+        cubelist_out = []
+        for attr, new_name in zip(
+            ["temperature", "pressure"], ["temperature", "pressure_si"]
+        ):
+            cube_out = iris.util.reverse(getattr(self, attr), self.z_name)
+            cube_out.rename(new_name)
+            cube_out.coord(self.z_name).rename("altitude")
+            cubelist_out.append(cube_out)
+        iris.save(cubelist_out, _outdir / f"{self._file_label}_p_t_profile.nc")
+
+    def mk_vert_lev_file(
+        self,
+        first_constant_r_rho_level: Optional[int] = 1,
+        outdir: Optional[Path] = None,
+    ) -> None:
+        """Make a file with vertical levels for the UM."""
+        if (_outdir := outdir) is None:
+            _outdir = self.data_dir / self.sim_case
+        theta_lev_m = self.height.data
+        z_top = theta_lev_m[-1]
+        theta_lev = theta_lev_m / z_top
+        rho_lev = 0.5 * (theta_lev[:-1] + theta_lev[1:])
+        nml = f90nml.Namelist(
+            {
+                "VERTLEVS": {
+                    "z_top_of_model": z_top,
+                    "first_constant_r_rho_level": first_constant_r_rho_level,
+                    "eta_theta": list(theta_lev),
+                    "eta_rho": list(rho_lev),
+                }
+            }
+        )
+        nml.write(_outdir / f"vertlevs_{self._file_label}", force=True, sort=True)
+
+    def replace_profiles_in_dump(
+        self,
+        path_to_dump: Path,
+        updates: dict[int, str],
+        inplace: Optional[bool] = True,
+    ) -> Optional[Path]:
+        """
+        Set several fields in the dump to horizontally uniform values.
+
+        The dump is read and written only once.
+
+        Parameters
+        ----------
+        path_to_dump: Path
+            Path to the UM dump.
+        updates: dict
+            Mapping of STASH item codes to the names of the container's variables.
+        inplace: bool, optional
+            Overwrite the original dump; otherwise return the path to the new one.
+        """
+        ff_dump = mule.DumpFile.from_file(str(path_to_dump))
+        for stash_item, variable in updates.items():
+            set_fields_to_real(ff_dump, getattr(self, variable), stash_item)
+        suffix = "_".join(
+            f"{stash_item:>03d}_{variable}" for stash_item, variable in updates.items()
+        )
+        new_name = f"{path_to_dump.name}_mod_{suffix}"
+        new_name_full = path_to_dump.with_name(new_name)
+        ff_dump.to_file(str(new_name_full))
+        if inplace:
+            new_name_full.replace(path_to_dump)
+        else:
+            return new_name_full
@@ -2,6 +2,7 @@
 """Utilities to modify UM dumps (fields files)."""
 from warnings import warn
 
+import numpy as np
 from mule.operators import AddScalarOperator, ScaleFactorOperator
 
 __all__ = ("zero_operator", "set_fields_to_real")
@@ -26,13 +27,14 @@ def set_fields_to_real(ff, cube, lbuser4):
     lbuser4: int
         STASH item code of the relevant variable.
     """
-    ilev = 0
-    for ifield, field in enumerate(ff.fields):
-        if field.lbuser4 == lbuser4:
-            try:
-                value = float(cube.data[ilev])
-                value_operator = AddScalarOperator(value)
-                ff.fields[ifield] = value_operator(zero_operator(field))
-            except IndexError:
-                warn(f"Skipping level {ilev:>3d}")
-            ilev += 1
+    # Realise the (possibly lazy) cube data once
+    values = np.asarray(cube.data)
+    value_operators = [AddScalarOperator(float(value)) for value in values]
+    target_idx = [
+        ifield for ifield, field in enumerate(ff.fields) if field.lbuser4 == lbuser4
+    ]
+    for ilev, ifield in enumerate(target_idx):
+        if ilev >= values.size:
+            warn(f"Skipping level {ilev:>3d}")
+            continue
+        ff.fields[ifield] = value_operators[ilev](zero_operator(ff.fields[ifield]))
@@ -15,31 +15,19 @@ def write_1d_data_to_namelist_format(
     arr_1d, decl_line, values_per_line=VALUES_PER_LINE, line_length=LINE_LENGTH, fmt=FMT
 ):
     """Write 1D data with a given precision to a list of strings in a Fortran namelist format."""
-    nvals = len(arr_1d)
-    lines = []
-    values = []
-
-    lines.append(decl_line)
-    for idx, value in enumerate(arr_1d):
-        # Loop each value of
-        values.append(f"{value:{fmt}}")
-        # Condition A:
-        # if there are already `values_per_line` values appended to the current line
-        cond_a = (idx + 1) % values_per_line == 0
-        # Condition B:
-        # It's the last element
-        cond_b = idx == nvals - 1
-        if cond_a or cond_b:
-            # If either condition is satisfied, convert the list of values into a string
-            line = ",".join(values)
-            if len(line) > line_length:
-                raise ValueError(
-                    f"Line is too long ({len(line)=}>{line_length=}). "
-                    "Reduce precision or the number of values per line."
-                )
-            line = f" {line + ',':<{line_length-1}}"
-            lines.append(line)
-            values = []
+    values = [f"{value:{fmt}}" for value in arr_1d]
+    lines = [decl_line]
+    for idx_start in range(0, len(values), values_per_line):
+        # Join up to `values_per_line` values into one line
+        idx_end = idx_start + values_per_line
+        line = ",".join(values[idx_start:idx_end])
+        if len(line) > line_length:
+            raise ValueError(
+                f"Line is too long ({len(line)=}>{line_length=}). "
+                "Reduce precision or the number of values per line."
+            )
+        line = f" {line + ',':<{line_length-1}}"
+        lines.append(line)
     return lines
 
 